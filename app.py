@@ -8,14 +8,17 @@ such as unissued, requesting, validating, issued, and handles transitions betwee
 The API uses FastAPI for the web framework and SQLAlchemy for database interactions.
 """
 
+import asyncio
 import logging
+import os
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import Integer, bindparam, event, inspect, text, update
 from sqlalchemy.future import select
-from transitions import Machine
-from models import CertDomain  # Assuming models.py is in the same directory
+from models import CertDomain, CertState  # Assuming models.py is in the same directory
 from certbot_mock import CertbotMock
 
 # Configure logging
@@ -25,39 +28,164 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="CertFSM Dashboard")
-engine = create_engine("sqlite:///certfsm.db")
+app = FastAPI(title="CertFSM Dashboard", default_response_class=ORJSONResponse)
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+aiosqlite:///certfsm.db")
+
+# Explicit pool sizing so concurrent requests queue for a bounded number of
+# connections; pre-ping and recycle discard connections the server has dropped.
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=False,
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
+)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune each new sqlite connection for concurrent, write-heavy use.
+        
+        WAL lets readers proceed while a write is in progress, and synchronous=NORMAL
+        avoids an fsync on every commit (still durable across application crashes).
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+# Domain lookup built once and reused with a bound parameter: {"d": domain}
+_DOMAIN_LOOKUP = select(CertDomain).where(CertDomain.domain == bindparam("d"))
+
+# Short-lived per-domain cache of status checks so polling bursts hit the DB once.
+# Entries are invalidated when this process writes a domain's state; writes made by
+# other processes are only picked up once the entry expires.
+_STATUS_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=10)
+
+# Token per domain for the status check currently allowed to fill the cache.
+# Invalidation discards the token, so a check that read the domain before a
+# concurrent write doesn't cache its now stale result.
+_STATUS_CHECKS: dict[str, object] = {}
+
+
+def _invalidate_status(domain: str):
+    """
+    Drop the cached status of a domain after its state has been written.
+    
+    Args:
+        domain (str): Domain name whose cached status is stale
+    """
+    _STATUS_CACHE.pop(domain, None)
+    _STATUS_CHECKS.pop(domain, None)
+
+# Transient states ("requesting", "renewing") of certbot operations in flight,
+# keyed by domain. They are reported to clients but never committed.
+_PENDING_STATES: dict[str, str] = {}
 
 # Initialize certbot mock for testing
 certbot = CertbotMock(success_rate=0.9, delay=1.0)
 
-def init_db():
+def _migrate_state_column(conn):
+    """
+    Convert a text certdomain.state column to CertState small integers.
+    
+    Databases created before states were stored as integers hold the state names
+    as text. They are rewritten in place; once converted this is a no-op.
+    
+    Args:
+        conn: Synchronous SQLAlchemy connection, as passed by run_sync.
+    
+    Raises:
+        RuntimeError: If the column holds unknown state names, or the database
+            backend has no supported conversion.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table(CertDomain.__tablename__):
+        return
+    column = next(c for c in inspector.get_columns(CertDomain.__tablename__) if c["name"] == "state")
+    if isinstance(column["type"], Integer):
+        return
+    
+    # Check every value before touching the schema so a bad row leaves the database as it was
+    names = {row[0] for row in conn.execute(text("SELECT DISTINCT state FROM certdomain"))}
+    unknown = names - set(CertState.__members__)
+    if unknown:
+        raise RuntimeError(
+            f"Cannot migrate certdomain.state to integers: unknown state values {sorted(unknown)}"
+        )
+    
+    logger.info("Migrating certdomain.state from state names to CertState values")
+    case = "CASE state " + " ".join(f"WHEN '{state.name}' THEN {state.value}" for state in CertState) + " END"
+    if conn.dialect.name == "sqlite":
+        # sqlite can't change a column's type in place, so rebuild the table
+        for index in inspector.get_indexes(CertDomain.__tablename__):
+            conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+        conn.execute(text("ALTER TABLE certdomain RENAME TO certdomain_old"))
+        CertDomain.__table__.create(conn)
+        columns = ", ".join(c.name for c in CertDomain.__table__.columns if c.name != "state")
+        conn.execute(text(
+            f"INSERT INTO certdomain ({columns}, state) SELECT {columns}, {case} FROM certdomain_old"
+        ))
+        conn.execute(text("DROP TABLE certdomain_old"))
+    elif conn.dialect.name == "postgresql":
+        conn.execute(text(f"ALTER TABLE certdomain ALTER COLUMN state TYPE SMALLINT USING {case}"))
+    else:
+        raise RuntimeError(
+            f"Cannot migrate certdomain.state to integers on {conn.dialect.name}; "
+            "convert the column to CertState values manually"
+        )
+
+
+def _create_schema(conn):
+    """
+    Create missing tables and indexes, migrating older schemas first.
+    
+    Args:
+        conn: Synchronous SQLAlchemy connection, as passed by run_sync.
+    """
+    _migrate_state_column(conn)
+    CertDomain.metadata.create_all(conn)
+    # create_all skips indexes of tables that already exist
+    for index in CertDomain.__table__.indexes:
+        index.create(conn, checkfirst=True)
+
+
+async def init_db():
     """
     Initialize the database by creating all tables defined in the models.
     
-    This function creates the database schema based on the SQLAlchemy models.
+    This function creates the database schema based on the SQLAlchemy models,
+    converting a text state column left by older versions to CertState values.
+    The engine is disposed afterwards so no pooled connections outlive the
+    event loop used for initialization.
     """
-    CertDomain.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_schema)
+    await engine.dispose()
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
-def get_session():
+async def get_session():
     """
     Create a new database session for dependency injection.
     
     Yields:
-        Session: SQLAlchemy database session that will be automatically closed after use.
+        AsyncSession: SQLAlchemy async database session that will be automatically closed after use.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # FSM states
-FSM_STATES = ['unissued', 'requesting', 'validating', 'issued', 'renewing', 'renewed', 'failed', 'expired', 'revoked', 'invalid']
+FSM_STATES = [state.name for state in CertState]
 FSM_TRANSITIONS = [
     {"trigger": "request_cert", "source": "unissued", "dest": "requesting"},
     {"trigger": "validate_ok", "source": "validating", "dest": "issued"},
@@ -69,133 +197,171 @@ FSM_TRANSITIONS = [
     {"trigger": "continue_cycle", "source": "renewed", "dest": "issued"}
 ]
 
+# States from which each certbot operation may be started
+ISSUE_OK = frozenset({CertState.unissued, CertState.failed, CertState.expired})
+RENEW_OK = frozenset({CertState.issued})
+REVOKE_OK = frozenset({CertState.issued, CertState.renewed})
+
+# Precomputed (source_state, trigger) -> dest_state lookup, with wildcard
+# sources expanded across every state
+TRANSITION_TABLE: dict[tuple[CertState, str], CertState] = {}
+for _transition in FSM_TRANSITIONS:
+    _sources = list(CertState) if _transition["source"] == "*" else [CertState[_transition["source"]]]
+    for _source in _sources:
+        TRANSITION_TABLE[(_source, _transition["trigger"])] = CertState[_transition["dest"]]
+FSM_TRIGGERS = frozenset(_transition["trigger"] for _transition in FSM_TRANSITIONS)
+
 # Certbot operation helper functions
-async def perform_certificate_issuance(domain: str, background_tasks: BackgroundTasks, session: Session):
+# CertDomain.updated_at is maintained by its onupdate default and is never set here
+async def _update_domain(entry_id: int, domain: str, **values) -> bool:
+    """
+    Write certificate operation results for a domain with a single Core UPDATE.
+    
+    Background tasks only record outcomes, so they skip the ORM session and its
+    identity map and unit of work entirely. last_checked is stamped on every write.
+    
+    Args:
+        entry_id (int): Primary key of the domain record to update
+        domain (str): Domain name of the record, used for cache invalidation and logging
+        **values: Column values to set
+    
+    Returns:
+        bool: True if the domain exists and was updated, False otherwise.
+    """
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            update(CertDomain)
+            .where(CertDomain.id == entry_id)
+            .values(last_checked=datetime.now(timezone.utc), **values)
+        )
+    _invalidate_status(domain)
+    if result.rowcount == 0:
+        logger.error(f"Domain {domain} not found in database")
+        return False
+    return True
+
+
+async def perform_certificate_issuance(entry_id: int, domain: str):
     """
     Perform certificate issuance operation using certbot mock.
     
     Args:
+        entry_id (int): Primary key of the domain record, loaded by the request handler
         domain (str): Domain name to issue certificate for
-        background_tasks (BackgroundTasks): FastAPI background tasks object
-        session (Session): Database session
     """
     logger.info(f"Starting certificate issuance process for {domain}")
     
-    # Get domain record
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
-    if not entry:
-        logger.error(f"Domain {domain} not found in database")
-        return
-    
-    # Update state to requesting
-    setattr(entry, "state", "requesting")
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
-    session.add(entry)
-    session.commit()
-    
-    # Perform mock certbot operation
-    success, error_msg, expires_at = certbot.issue_certificate(domain)
-    
-    # Update database based on result
-    if success:
-        setattr(entry, "state", "issued")
-        setattr(entry, "expires_at", expires_at)
-        setattr(entry, "last_error", None)
-    else:
-        setattr(entry, "state", "failed")
-        setattr(entry, "last_error", error_msg)
-    
-    setattr(entry, "last_checked", datetime.now(timezone.utc))
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
-    session.add(entry)
-    session.commit()
-    logger.info(f"Certificate issuance for {domain} completed with status: {entry.state}")
+    # The in-progress state is only published in memory; the record is
+    # written once, with the final outcome
+    _PENDING_STATES[domain] = CertState.requesting.name
+    _invalidate_status(domain)
+    try:
+        # Perform mock certbot operation
+        success, error_msg, expires_at = await certbot.issue_certificate(domain)
+    
+        # Update database based on result
+        if success:
+            state = CertState.issued
+            updated = await _update_domain(entry_id, domain, state=state, expires_at=expires_at, last_error=None)
+        else:
+            state = CertState.failed
+            updated = await _update_domain(entry_id, domain, state=state, last_error=error_msg)
+    finally:
+        _PENDING_STATES.pop(domain, None)
+        _invalidate_status(domain)
+    if updated:
+        logger.info(f"Certificate issuance for {domain} completed with status: {state.name}")
 
 
-async def perform_certificate_renewal(domain: str, background_tasks: BackgroundTasks, session: Session):
+async def perform_certificate_renewal(entry_id: int, domain: str):
     """
     Perform certificate renewal operation using certbot mock.
     
     Args:
+        entry_id (int): Primary key of the domain record, loaded by the request handler
         domain (str): Domain name to renew certificate for
-        background_tasks (BackgroundTasks): FastAPI background tasks object
-        session (Session): Database session
     """
     logger.info(f"Starting certificate renewal process for {domain}")
     
-    # Get domain record
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
-    if not entry:
-        logger.error(f"Domain {domain} not found in database")
-        return
-    
-    # Update state to renewing
-    setattr(entry, "state", "renewing")
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
-    session.add(entry)
-    session.commit()
-    
-    # Perform mock certbot operation
-    success, error_msg, expires_at = certbot.renew_certificate(domain)
-    
-    # Update database based on result
-    if success:
-        setattr(entry, "state", "renewed")
-        setattr(entry, "expires_at", expires_at)
-        setattr(entry, "last_error", None)
-    else:
-        setattr(entry, "state", "failed")
-        setattr(entry, "last_error", error_msg)
-    
-    setattr(entry, "last_checked", datetime.now(timezone.utc))
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
-    session.add(entry)
-    session.commit()
-    logger.info(f"Certificate renewal for {domain} completed with status: {entry.state}")
+    # The in-progress state is only published in memory; the record is
+    # written once, with the final outcome
+    _PENDING_STATES[domain] = CertState.renewing.name
+    _invalidate_status(domain)
+    try:
+        # Perform mock certbot operation
+        success, error_msg, expires_at = await certbot.renew_certificate(domain)
+    
+        # Update database based on result
+        if success:
+            state = CertState.renewed
+            updated = await _update_domain(entry_id, domain, state=state, expires_at=expires_at, last_error=None)
+        else:
+            state = CertState.failed
+            updated = await _update_domain(entry_id, domain, state=state, last_error=error_msg)
+    finally:
+        _PENDING_STATES.pop(domain, None)
+        _invalidate_status(domain)
+    if updated:
+        logger.info(f"Certificate renewal for {domain} completed with status: {state.name}")
 
 
-async def perform_certificate_revocation(domain: str, background_tasks: BackgroundTasks, session: Session):
+async def perform_certificate_revocation(entry_id: int, domain: str):
     """
     Perform certificate revocation operation using certbot mock.
     
     Args:
+        entry_id (int): Primary key of the domain record, loaded by the request handler
         domain (str): Domain name to revoke certificate for
-        background_tasks (BackgroundTasks): FastAPI background tasks object
-        session (Session): Database session
     """
     logger.info(f"Starting certificate revocation process for {domain}")
     
-    # Get domain record
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
-    if not entry:
-        logger.error(f"Domain {domain} not found in database")
-        return
-    
     # Perform mock certbot operation
-    success, error_msg = certbot.revoke_certificate(domain)
+    success, error_msg = await certbot.revoke_certificate(domain)
     
     # Update database based on result
     if success:
-        setattr(entry, "state", "revoked")
-        setattr(entry, "last_error", None)
+        state = CertState.revoked
+        updated = await _update_domain(entry_id, domain, state=state, last_error=None)
     else:
-        setattr(entry, "state", "failed")
-        setattr(entry, "last_error", error_msg)
-    
-    setattr(entry, "last_checked", datetime.now(timezone.utc))
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
-    session.add(entry)
-    session.commit()
-    logger.info(f"Certificate revocation for {domain} completed with status: {entry.state}")
+        state = CertState.failed
+        updated = await _update_domain(entry_id, domain, state=state, last_error=error_msg)
+    if updated:
+        logger.info(f"Certificate revocation for {domain} completed with status: {state.name}")
 
 
-async def check_certificate_status(domain: str, session: Session):
+async def check_certificate_status(domain: str, session: AsyncSession):
     """
     Check certificate status using certbot mock.
     
     Args:
         domain (str): Domain name to check certificate for
-        session (Session): Database session
+        session (AsyncSession): Database session
+    
+    Returns:
+        dict: Status information about the certificate
+    """
+    if (cached := _STATUS_CACHE.get(domain)):
+        return cached
+    
+    # Claim the cache slot before the first await; see _STATUS_CHECKS
+    token = _STATUS_CHECKS[domain] = object()
+    try:
+        result = await _run_certificate_status_check(domain, session)
+        if _STATUS_CHECKS.get(domain) is token and result["status"] != "error":
+            _STATUS_CACHE[domain] = result
+        return result
+    finally:
+        if _STATUS_CHECKS.get(domain) is token:
+            del _STATUS_CHECKS[domain]
+
+
+async def _run_certificate_status_check(domain: str, session: AsyncSession):
+    """
+    Check certificate status using certbot mock, bypassing the status cache.
+    
+    Args:
+        domain (str): Domain name to check certificate for
+        session (AsyncSession): Database session
     
     Returns:
         dict: Status information about the certificate
@@ -203,33 +369,32 @@ async def check_certificate_status(domain: str, session: Session):
     logger.info(f"Checking certificate status for {domain}")
     
     # Get domain record
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    entry = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if not entry:
         logger.error(f"Domain {domain} not found in database")
-        return {"status": "error", "message": "Domain not found"}
+        return {"domain": domain, "status": "error", "message": "Domain not found"}
     
     # Perform mock certbot check
     is_valid, status, expires_at = certbot.check_certificate(domain)
     
     # Update database based on result
-    setattr(entry, "last_checked", datetime.now(timezone.utc))
+    entry.last_checked = datetime.now(timezone.utc)
     
-    if status == "expired" and str(entry.state) != "expired":
-        setattr(entry, "state", "expired")
-        setattr(entry, "updated_at", datetime.now(timezone.utc))
+    if status == "expired" and entry.state != CertState.expired:
+        entry.state = CertState.expired
     
     if expires_at:
-        setattr(entry, "expires_at", expires_at)
+        entry.expires_at = expires_at
     
     session.add(entry)
-    session.commit()
+    await session.commit()
     
     return {
         "domain": domain,
         "is_valid": is_valid,
         "status": status,
-        "expires_at": expires_at.isoformat() if expires_at else None,
-        "state": entry.state
+        "expires_at": expires_at,
+        "state": _PENDING_STATES.get(domain, entry.state_name)
     }
 
 # Root route
@@ -266,7 +431,7 @@ def get_fsm_states():
     Returns:
         dict: Dictionary containing the list of all possible states.
     """
-    return {"states": FSM_STATES}
+    return STATES_RESPONSE
 
 # Get FSM transitions
 @app.get("/fsm/transitions")
@@ -280,7 +445,7 @@ def get_fsm_transitions():
     Returns:
         dict: Dictionary containing the list of all possible transitions.
     """
-    return {"transitions": FSM_TRANSITIONS}
+    return TRANSITIONS_RESPONSE
 
 # Get FSM transitions available from a specific state
 @app.get("/fsm/transitions/{state}")
@@ -300,22 +465,7 @@ def get_state_transitions(state: str):
     if state not in FSM_STATES:
         raise HTTPException(status_code=404, detail=f"State '{state}' not found")
         
-    # Filter transitions that can be triggered from the given state
-    available_transitions = []
-    for transition in FSM_TRANSITIONS:
-        # Check if this transition can be triggered from the current state
-        # Either the source matches exactly or it's a wildcard "*"
-        if transition["source"] == state or transition["source"] == "*":
-            available_transitions.append({
-                "trigger": transition["trigger"],
-                "dest": transition["dest"],
-                "description": get_transition_description(transition["trigger"])
-            })
-    
-    return {
-        "state": state,
-        "available_transitions": available_transitions
-    }
+    return PER_STATE_RESPONSES[state]
 
 def get_transition_description(trigger: str) -> str:
     """
@@ -340,15 +490,35 @@ def get_transition_description(trigger: str) -> str:
     
     return descriptions.get(trigger, trigger.replace("_", " ").capitalize())
 
+# The FSM definition is immutable, so the metadata responses are built once at import
+STATES_RESPONSE = {"states": FSM_STATES}
+TRANSITIONS_RESPONSE = {"transitions": FSM_TRANSITIONS}
+PER_STATE_RESPONSES: dict[str, dict] = {
+    state: {
+        "state": state,
+        # Either the source matches exactly or it's a wildcard "*"
+        "available_transitions": [
+            {
+                "trigger": transition["trigger"],
+                "dest": transition["dest"],
+                "description": get_transition_description(transition["trigger"])
+            }
+            for transition in FSM_TRANSITIONS
+            if transition["source"] == state or transition["source"] == "*"
+        ]
+    }
+    for state in FSM_STATES
+}
+
 # Create a new domain entry
 @app.post("/domains/", response_model=dict)
-def add_domain(domain: str, session: Session = Depends(get_session)):
+async def add_domain(domain: str, session: AsyncSession = Depends(get_session)):
     """
     Create a new domain entry in the certificate management system.
     
     Args:
         domain (str): The domain name to add for certificate management.
-        session (Session, optional): Database session. Defaults to Depends(get_session).
+        session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
     
     Raises:
         HTTPException: 400 error if domain already exists.
@@ -356,36 +526,37 @@ def add_domain(domain: str, session: Session = Depends(get_session)):
     Returns:
         dict: Information about the newly created domain entry.
     """
-    existing = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    existing = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=400, detail="Domain already exists")
 
-    entry = CertDomain(domain=domain, state="unissued")
+    entry = CertDomain(domain=domain, state=CertState.unissued)
     session.add(entry)
-    session.commit()
-    session.refresh(entry)
-    return {"domain": entry.domain, "state": entry.state}
+    await session.commit()
+    await session.refresh(entry)
+    return {"domain": entry.domain, "state": entry.state_name}
 
 
 # List domains
 @app.get("/domains/", response_model=list)
-def list_domains(session: Session = Depends(get_session)):
+async def list_domains(session: AsyncSession = Depends(get_session)):
     """
     List all domains currently registered in the certificate management system.
     
     Args:
-        session (Session, optional): Database session. Defaults to Depends(get_session).
+        session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
     
     Returns:
         list: List of dictionaries containing domain information.
     """
-    domains = session.execute(select(CertDomain)).scalars().all()
-    return [{"domain": domain.domain, "state": domain.state} for domain in domains]
+    # Select only the columns we return; plain rows skip ORM object construction
+    rows = (await session.execute(select(CertDomain.domain, CertDomain.state))).all()
+    return [{"domain": domain, "state": _PENDING_STATES.get(domain, CertState(state).name)} for domain, state in rows]
 
 
 # Trigger FSM transition
 @app.post("/domains/{domain}/transition/{event}")
-def transition_domain(domain: str, event: str, session: Session = Depends(get_session)):
+async def transition_domain(domain: str, event: str, session: AsyncSession = Depends(get_session)):
     """
     Trigger a state transition for a domain in the certificate lifecycle.
     
@@ -395,179 +566,204 @@ def transition_domain(domain: str, event: str, session: Session = Depends(get_se
     Args:
         domain (str): The domain name to transition.
         event (str): The event trigger name (matching one of the defined transition triggers).
-        session (Session, optional): Database session. Defaults to Depends(get_session).
+        session (AsyncSession, optional): Database session. Defaults to Depends(get_session).
     
     Raises:
-        HTTPException: 404 error if domain not found, 400 error if transition is invalid.
+        HTTPException: 404 error if domain not found, 400 error if a certbot operation is
+            in progress, or the event is unknown or not allowed from the domain's current state.
     
     Returns:
         dict: Information about the domain and its new state after transition.
     """
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    entry = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if not entry:
         raise HTTPException(status_code=404, detail="Domain not found")
 
-    # Bind FSM
-    class FSMWrapper:
-        """
-        Wrapper class for the transitions state machine.
-        
-        This class provides a property interface for state management
-        that the transitions library can use.
-        
-        Args:
-            current_state (str): The initial state of the FSM.
-        """
-        def __init__(self, current_state: str):
-            self._state = current_state
-            
-        @property
-        def state(self):
-            """Get the current state."""
-            return self._state
-            
-        @state.setter
-        def state(self, value):
-            """Set the current state."""
-            self._state = value
-
-    # Create FSM model with current state
-    current_state = str(entry.state)
-    model = FSMWrapper(current_state)
-    # Initialize machine with model and transitions
-    Machine(
-        model=model, 
-        states=FSM_STATES, 
-        transitions=FSM_TRANSITIONS, 
-        initial=current_state
-    )
-
-    try:
-        # Trigger the event
-        getattr(model, event)()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Transition failed: {str(e)}")
-    # Get the new state after transition
-    new_state = model.state
+    # A certbot operation in flight owns the state until it commits its outcome
+    if domain in _PENDING_STATES:
+        raise HTTPException(status_code=400, detail=f"Transition failed: a certbot operation is in progress (state '{_PENDING_STATES[domain]}')")
+    
+    if event not in FSM_TRIGGERS:
+        raise HTTPException(status_code=400, detail=f"Transition failed: unknown event '{event}'")
+    
+    # Look up the destination state for this event
+    new_state = TRANSITION_TABLE.get((entry.state, event))
+    if new_state is None:
+        raise HTTPException(status_code=400, detail=f"Transition failed: event '{event}' is not allowed from state '{entry.state_name}'")
     
     # Update database entry - reuse the existing entry object
-    setattr(entry, "state", new_state)
-    setattr(entry, "last_checked", datetime.now(timezone.utc))
-    setattr(entry, "updated_at", datetime.now(timezone.utc))
+    entry.state = new_state
+    entry.last_checked = datetime.now(timezone.utc)
     session.add(entry)
-    session.commit()
+    await session.commit()
+    _invalidate_status(domain)
 
-    return {"domain": domain, "new_state": new_state}
+    return {"domain": domain, "new_state": new_state.name}
 
 
 # Certbot mock integration endpoints
 
 @app.post("/certbot/issue/{domain}")
-async def issue_certificate(domain: str, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
+async def issue_certificate(domain: str, background_tasks: BackgroundTasks, session: AsyncSession = Depends(get_session)):
     """
     Trigger certificate issuance for a domain using certbot mock.
     
     Args:
         domain (str): Domain to issue certificate for
         background_tasks (BackgroundTasks): FastAPI background tasks
-        session (Session): Database session
+        session (AsyncSession): Database session
         
     Returns:
         dict: Status of the operation
     """
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    entry = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if not entry:
         raise HTTPException(status_code=404, detail="Domain not found")
     
-    if entry.state not in ["unissued", "failed", "expired"]:
-        raise HTTPException(status_code=400, detail=f"Cannot issue certificate for domain in state: {entry.state}")
+    if domain in _PENDING_STATES:
+        raise HTTPException(status_code=400, detail=f"Cannot issue certificate for domain in state: {_PENDING_STATES[domain]}")
+    
+    if entry.state not in ISSUE_OK:
+        raise HTTPException(status_code=400, detail=f"Cannot issue certificate for domain in state: {entry.state_name}")
     
     # Trigger issuance in background
-    background_tasks.add_task(perform_certificate_issuance, domain, background_tasks, session)
+    background_tasks.add_task(perform_certificate_issuance, entry.id, domain)
     
-    return {"status": "started", "message": f"Certificate issuance started for {domain}", "previous_state": entry.state}
+    return {"status": "started", "message": f"Certificate issuance started for {domain}", "previous_state": entry.state_name}
 
 
 @app.post("/certbot/renew/{domain}")
-async def renew_certificate(domain: str, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
+async def renew_certificate(domain: str, background_tasks: BackgroundTasks, session: AsyncSession = Depends(get_session)):
     """
     Trigger certificate renewal for a domain using certbot mock.
     
     Args:
         domain (str): Domain to renew certificate for
         background_tasks (BackgroundTasks): FastAPI background tasks
-        session (Session): Database session
+        session (AsyncSession): Database session
         
     Returns:
         dict: Status of the operation
     """
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    entry = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if not entry:
         raise HTTPException(status_code=404, detail="Domain not found")
     
-    if entry.state not in ["issued"]:
-        raise HTTPException(status_code=400, detail=f"Cannot renew certificate for domain in state: {entry.state}")
+    if domain in _PENDING_STATES:
+        raise HTTPException(status_code=400, detail=f"Cannot renew certificate for domain in state: {_PENDING_STATES[domain]}")
+    
+    if entry.state not in RENEW_OK:
+        raise HTTPException(status_code=400, detail=f"Cannot renew certificate for domain in state: {entry.state_name}")
     
     # Trigger renewal in background
-    background_tasks.add_task(perform_certificate_renewal, domain, background_tasks, session)
+    background_tasks.add_task(perform_certificate_renewal, entry.id, domain)
     
-    return {"status": "started", "message": f"Certificate renewal started for {domain}", "previous_state": entry.state}
+    return {"status": "started", "message": f"Certificate renewal started for {domain}", "previous_state": entry.state_name}
 
 
 @app.post("/certbot/revoke/{domain}")
-async def revoke_certificate(domain: str, background_tasks: BackgroundTasks, session: Session = Depends(get_session)):
+async def revoke_certificate(domain: str, background_tasks: BackgroundTasks, session: AsyncSession = Depends(get_session)):
     """
     Trigger certificate revocation for a domain using certbot mock.
     
     Args:
         domain (str): Domain to revoke certificate for
         background_tasks (BackgroundTasks): FastAPI background tasks
-        session (Session): Database session
+        session (AsyncSession): Database session
         
     Returns:
         dict: Status of the operation
     """
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
+    entry = (await session.execute(_DOMAIN_LOOKUP, {"d": domain})).scalar_one_or_none()
     if not entry:
         raise HTTPException(status_code=404, detail="Domain not found")
     
-    if entry.state not in ["issued", "renewed"]:
-        raise HTTPException(status_code=400, detail=f"Cannot revoke certificate for domain in state: {entry.state}")
+    if domain in _PENDING_STATES:
+        raise HTTPException(status_code=400, detail=f"Cannot revoke certificate for domain in state: {_PENDING_STATES[domain]}")
+    
+    if entry.state not in REVOKE_OK:
+        raise HTTPException(status_code=400, detail=f"Cannot revoke certificate for domain in state: {entry.state_name}")
     
     # Trigger revocation in background
-    background_tasks.add_task(perform_certificate_revocation, domain, background_tasks, session)
+    background_tasks.add_task(perform_certificate_revocation, entry.id, domain)
     
-    return {"status": "started", "message": f"Certificate revocation started for {domain}", "previous_state": entry.state}
+    return {"status": "started", "message": f"Certificate revocation started for {domain}", "previous_state": entry.state_name}
 
 
 @app.get("/certbot/status/{domain}")
-async def get_certificate_status(domain: str, session: Session = Depends(get_session)):
+async def get_certificate_status(domain: str, session: AsyncSession = Depends(get_session)):
     """
     Check certificate status for a domain using certbot mock.
     
     Args:
         domain (str): Domain to check certificate status for
-        session (Session): Database session
+        session (AsyncSession): Database session
         
     Returns:
         dict: Certificate status information
     """
-    entry = session.execute(select(CertDomain).where(CertDomain.domain == domain)).scalar_one_or_none()
-    if not entry:
-        raise HTTPException(status_code=404, detail="Domain not found")
-    
-    # Check status
+    # Check status; served from the cache without touching the DB when fresh
     status_info = await check_certificate_status(domain, session)
+    if status_info["status"] == "error":
+        raise HTTPException(status_code=404, detail="Domain not found")
     
     return status_info
 
+
+async def _check_certificate_status_isolated(domain: str):
+    """
+    Check certificate status for a domain using its own database session.
+    
+    An AsyncSession must not be shared between concurrently running tasks, so
+    each check fanned out by the bulk endpoint gets a dedicated session.
+    
+    Args:
+        domain (str): Domain name to check certificate for
+    
+    Returns:
+        dict: Status information about the certificate
+    """
+    async with SessionLocal() as session:
+        return await check_certificate_status(domain, session)
+
+
+@app.post("/certbot/status/bulk")
+async def get_bulk_certificate_status(domains: list[str]):
+    """
+    Check certificate status for several domains concurrently.
+    
+    Args:
+        domains (list[str]): Domains to check certificate status for
+        
+    Returns:
+        list: Certificate status information for each domain, in request order.
+            Unknown domains are reported with a status of "error".
+    """
+    return await asyncio.gather(*(_check_certificate_status_isolated(domain) for domain in domains))
+
 if __name__ == "__main__":
     """
     Main entry point for running the application directly.
     
-    Initializes the database and starts the Uvicorn ASGI server with hot reload enabled.
+    Initializes the database and starts the Uvicorn ASGI server on uvloop with the
+    httptools parser. A single worker is started unless WORKERS is set; DEV=1
+    enables hot reload (which runs a single worker).
+    
+    The certbot mock, in-flight operation states and status cache live in process
+    memory, so running more than one worker requires moving them to shared storage.
     """
-    init_db()
+    asyncio.run(init_db())
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, log_level="info", reload=True)
+    reload = os.environ.get("DEV") == "1"
+    workers = int(os.environ.get("WORKERS", 1))
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=None if reload else workers,
+    )
     
\ No newline at end of file
@@ -5,9 +5,10 @@ This module provides mock functions that simulate certbot CLI behavior without a
 interacting with the Let's Encrypt service or making system changes.
 """
 
+import asyncio
 import logging
 import random
-import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple
 
@@ -21,19 +22,26 @@ class CertbotMock:
     without making actual API calls to Let's Encrypt or modifying the system.
     """
     
-    def __init__(self, success_rate: float = 0.9, delay: float = 1.0):
+    def __init__(self, success_rate: float = 0.9, delay: float = 1.0, max_certs: int = 10_000,
+                 seed: Optional[int] = None):
         """
         Initialize the certbot mock.
         
         Args:
             success_rate (float, optional): Probability of successful operations. Defaults to 0.9.
             delay (float, optional): Simulated processing delay in seconds. Defaults to 1.0.
+            max_certs (int, optional): Maximum number of certificates to remember; the least
+                recently used one is evicted once exceeded. Defaults to 10_000.
+            seed (Optional[int], optional): Seed for the mock's private random generator, for
+                reproducible outcomes. Defaults to None.
         """
         self.success_rate = success_rate
         self.delay = delay
-        self.certs: Dict[str, Dict] = {}
+        self.certs: OrderedDict[str, Dict] = OrderedDict()
+        self._max = max_certs
+        self._rng = random.Random(seed)
         
-    def issue_certificate(self, domain: str) -> Tuple[bool, Optional[str], Optional[datetime]]:
+    async def issue_certificate(self, domain: str) -> Tuple[bool, Optional[str], Optional[datetime]]:
         """
         Simulate issuing a new certificate for a domain.
         
@@ -48,16 +56,23 @@ class CertbotMock:
         """
         logger.info(f"Mock: Issuing certificate for {domain}")
         # Simulate processing time
-        time.sleep(self.delay)
+        if self.delay:
+            await asyncio.sleep(self.delay)
         
         # Simulate success/failure based on probability
-        if random.random() < self.success_rate:
+        if self._rng.random() < self.success_rate:
             # Certificate issued successfully
-            expiry = datetime.now(timezone.utc) + timedelta(days=90)
+            now = datetime.now(timezone.utc)
+            expiry = now + timedelta(days=90)
+            # Reissuing replaces the entry at the most recent position; otherwise evict the oldest
+            if domain in self.certs:
+                self.certs.move_to_end(domain)
+            elif len(self.certs) >= self._max:
+                self.certs.popitem(last=False)
             self.certs[domain] = {
                 "status": "issued",
                 "expires_at": expiry,
-                "issued_at": datetime.now(timezone.utc)
+                "issued_at": now
             }
             logger.info(f"Mock: Certificate issued for {domain}, expires {expiry}")
             return True, None, expiry
@@ -67,7 +82,7 @@ class CertbotMock:
             logger.error(error_msg)
             return False, error_msg, None
     
-    def renew_certificate(self, domain: str) -> Tuple[bool, Optional[str], Optional[datetime]]:
+    async def renew_certificate(self, domain: str) -> Tuple[bool, Optional[str], Optional[datetime]]:
         """
         Simulate renewing an existing certificate.
         
@@ -87,10 +102,11 @@ class CertbotMock:
             return False, f"Mock: No certificate found for {domain}", None
         
         # Simulate processing time
-        time.sleep(self.delay)
+        if self.delay:
+            await asyncio.sleep(self.delay)
         
         # Simulate success/failure based on probability
-        if random.random() < self.success_rate:
+        if self._rng.random() < self.success_rate:
             # Certificate renewed successfully
             current_expiry = self.certs[domain]["expires_at"]
             new_expiry = current_expiry + timedelta(days=90)
@@ -104,7 +120,7 @@ class CertbotMock:
             logger.error(error_msg)
             return False, error_msg, None
     
-    def revoke_certificate(self, domain: str) -> Tuple[bool, Optional[str]]:
+    async def revoke_certificate(self, domain: str) -> Tuple[bool, Optional[str]]:
         """
         Simulate revoking a certificate.
         
@@ -123,10 +139,11 @@ class CertbotMock:
             return False, f"Mock: No certificate found for {domain}"
         
         # Simulate processing time
-        time.sleep(self.delay)
+        if self.delay:
+            await asyncio.sleep(self.delay)
         
         # Simulate success/failure based on probability
-        if random.random() < self.success_rate:
+        if self._rng.random() < self.success_rate:
             # Certificate revoked successfully
             self.certs[domain]["status"] = "revoked"
             self.certs[domain]["revoked_at"] = datetime.now(timezone.utc)
@@ -156,16 +173,18 @@ class CertbotMock:
         if domain not in self.certs:
             return False, "not_found", None
         
+        self.certs.move_to_end(domain)
         cert = self.certs[domain]
         if cert["status"] == "revoked":
             return False, "revoked", None
         
         expires_at = cert["expires_at"]
-        if expires_at < datetime.now(timezone.utc):
+        now = datetime.now(timezone.utc)
+        if expires_at < now:
             return False, "expired", expires_at
         
         # Check if certificate is close to expiry (within 30 days)
-        if expires_at < datetime.now(timezone.utc) + timedelta(days=30):
+        if expires_at < now + timedelta(days=30):
             return True, "expiring_soon", expires_at
         
         return True, "valid", expires_at
@@ -1,17 +1,35 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, DateTime, func
 from sqlalchemy.orm import declarative_base
 from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Optional
 
 Base = declarative_base()
 
+class CertState(IntEnum):
+    """
+    Certificate lifecycle states, stored as small integers in the database.
+    
+    The member names are the state names exposed through the API.
+    """
+    unissued = 0
+    requesting = 1
+    validating = 2
+    issued = 3
+    renewing = 4
+    renewed = 5
+    failed = 6
+    expired = 7
+    revoked = 8
+    invalid = 9
+
 class CertDomain(Base):
     __tablename__ = "certdomain"
     
     id = Column(Integer, primary_key=True)
     domain = Column(String, index=True, unique=True, nullable=False)
     enabled = Column(Boolean, default=True, nullable=False)
-    state = Column(String, default='unissued', nullable=False)
+    state = Column(SmallInteger, default=CertState.unissued.value, index=True, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), 
@@ -22,7 +40,17 @@ class CertDomain(Base):
     last_error = Column(String, nullable=True)
 
     def __repr__(self):
-        return f"<CertDomain(domain={self.domain}, state={self.state}, expires_at={self.expires_at})>"
+        return f"<CertDomain(domain={self.domain}, state={self.state_name}, expires_at={self.expires_at})>"
+    
+    @property
+    def state_name(self) -> str:
+        """
+        Get the name of the current state.
+        
+        Returns:
+            str: The state name as exposed through the API, e.g. 'issued'.
+        """
+        return CertState(self.state).name
     
     def is_expired(self) -> bool:
         """
@@ -42,7 +70,7 @@ class CertDomain(Base):
         Returns:
             bool: True if the certificate is revoked, False otherwise.
         """
-        return self.state == 'revoked'
+        return self.state == CertState.revoked
     
     def is_valid(self) -> bool:
         """
@@ -51,6 +79,6 @@ class CertDomain(Base):
         Returns:
             bool: True if the certificate is valid, False otherwise.
         """
-        return self.state == 'issued' and not self.is_expired() and not self.is_revoked()
+        return self.state == CertState.issued and not self.is_expired() and not self.is_revoked()
     
     
\ No newline at end of file